@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+""" Cold-start time of every cli.py subcommand.
+
+    Each run is a fresh interpreter, so the numbers include imports.
+    Usage: python benchmark.py [repeats] """
+
+import os
+import subprocess
+import sys
+import tempfile
+from statistics import median
+from time import perf_counter
+
+CLI = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cli.py')
+CORPUS = os.path.join(os.path.dirname(CLI), 'files/lab03/norm_wiki_nv.txt')
+
+
+def cold_start(args, repeats):
+    """ Return list of wall-clock times (s) of `python cli.py *args` """
+
+    times = []
+    for _ in range(repeats):
+        start = perf_counter()
+        subprocess.run([sys.executable, CLI] + args, check=True, stdout=subprocess.DEVNULL)
+        times.append(perf_counter() - start)
+
+    return times
+
+def main():
+    repeats = 10 if len(sys.argv) == 1 else int(sys.argv[1])
+
+    with tempfile.TemporaryDirectory() as directory:
+        sample = os.path.join(directory, 'sample.txt')
+        with open(CORPUS, 'r') as corpus, open(sample, 'w') as file:
+            file.write(corpus.read(10 ** 4))
+
+        compressed = os.path.join(directory, 'sample.bin')
+        subcommands = [
+            ('--help', ['--help']),
+            ('compress', ['compress', sample, '-o', compressed]),
+            ('decompress', ['decompress', compressed, '-o', os.devnull]),
+            ('entropy', ['entropy', sample]),
+            ('generate', ['generate', sample, '-n', '100']),
+        ]
+
+        print(f'Cold start ({repeats} runs, {sys.executable}):')
+        for name, args in subcommands:
+            times = cold_start(args, repeats)
+            print(f'  {name:<12} min: {min(times) * 1000:7.1f} ms   median: {median(times) * 1000:7.1f} ms')
+
+
+if __name__ == '__main__':
+    main()
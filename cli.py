@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+""" Single command-line entry point for the labs.
+
+    Usage: python cli.py [--log-file PATH] {compress,decompress,entropy,generate} ...
+
+    Only argparse/logging are imported up front; every subcommand imports the
+    lab module it needs (and numpy/bitarray with it) when it is run. """
+
+import argparse
+import logging
+import os
+import sys
+
+
+def configure_logging(filename, level=logging.DEBUG):
+    logging.basicConfig(filename=filename, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                        datefmt='%d-%m-%Y %I:%M:%S %p', level=level)
+
+def get_compressor(method, filename=None):
+    """ Return compressor instance for the given method """
+
+    if method == 'huffman':
+        from lab05_huffman import HuffmanCompressor
+        return HuffmanCompressor(filename=filename)
+
+    from lab04_fixed_length_compression import Compressor
+    return Compressor(filename=filename)
+
+# --- SUBCOMMANDS ---
+
+def compress(parser, args):
+    """ See: lab04_fixed_length_compression.py, lab05_huffman.py """
+
+    if not os.path.getsize(args.input):
+        parser.error(f'Nothing to compress! ({args.input} is empty)')
+
+    output = args.output or args.input + '.bin'
+    alphabet = args.alphabet or output + '.alphabet'
+
+    compressor = get_compressor(args.method, filename=args.input)
+    compressor.create()
+    compressor.encode()
+    compressor.save(output_filename=output, output_alphabet_filename=alphabet)
+
+def decompress(parser, args):
+    """ See: lab04_fixed_length_compression.py, lab05_huffman.py """
+
+    alphabet = args.alphabet or args.input + '.alphabet'
+
+    compressor = get_compressor(args.method)
+    try:
+        compressor.load(filename=args.input, alphabet=alphabet)
+        compressor.decode()
+        data = compressor.data
+    except FileNotFoundError:
+        parser.error(f'File not found! ({alphabet})')
+    except Exception as error:
+        # Wrong -m or corrupted files; the failure type depends on where the data breaks.
+        parser.error(f'Cannot decompress {args.input} with method {args.method}! ({error!r})')
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(data)
+    else:
+        sys.stdout.write(data)
+
+def entropy(parser, args):
+    """ See: lab03_conditional_entropy.py """
+
+    from lab03_conditional_entropy import calculate_conditional_entropy_on_file
+    print(calculate_conditional_entropy_on_file(args.input, args.depth, args.words))
+
+def generate(parser, args):
+    """ See: lab01_simple_markov_gen.py (letters), lab02_better_markov_gen.py (words) """
+
+    if args.words:
+        from lab02_better_markov_gen import exercise_3 as markov_generator
+    else:
+        from lab01_simple_markov_gen import exercise_5 as markov_generator
+
+    print(markov_generator(seed=args.seed, depth=args.depth, filename=args.input, output_length=args.length))
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description='Information theory and data compression methods')
+    parser.add_argument('--log-file', help='write debug log to this file (logging is off by default)')
+    subparsers = parser.add_subparsers(dest='command', metavar='command')
+    subparsers.required = True
+
+    methods = ('huffman', 'fixed')
+
+    subparser = subparsers.add_parser('compress', help='compress a text file')
+    subparser.add_argument('input')
+    subparser.add_argument('-o', '--output', help='default: INPUT.bin')
+    subparser.add_argument('-a', '--alphabet', help='default: OUTPUT.alphabet')
+    subparser.add_argument('-m', '--method', choices=methods, default='huffman')
+    subparser.set_defaults(handler=compress)
+
+    subparser = subparsers.add_parser('decompress', help='decompress a file created by compress')
+    subparser.add_argument('input')
+    subparser.add_argument('-o', '--output', help='default: stdout')
+    subparser.add_argument('-a', '--alphabet', help='default: INPUT.alphabet')
+    subparser.add_argument('-m', '--method', choices=methods, default='huffman')
+    subparser.set_defaults(handler=decompress)
+
+    subparser = subparsers.add_parser('entropy', help='(conditional) entropy of a text file')
+    subparser.add_argument('input')
+    subparser.add_argument('-d', '--depth', type=int, default=0, help='length of the condition (0: plain entropy)')
+    subparser.add_argument('-w', '--words', action='store_true', help='use words instead of characters')
+    subparser.set_defaults(handler=entropy)
+
+    subparser = subparsers.add_parser('generate', help='Markov chain text generator')
+    subparser.add_argument('input', metavar='corpus')
+    subparser.add_argument('-d', '--depth', type=int, default=1)
+    subparser.add_argument('-s', '--seed', default='')
+    subparser.add_argument('-n', '--length', type=int, default=10 ** 3, help='number of generated letters/words')
+    subparser.add_argument('-w', '--words', action='store_true', help='use words instead of letters')
+    subparser.set_defaults(handler=generate)
+
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if not os.path.isfile(args.input):
+        parser.error(f'File not found! ({args.input})')
+
+    if args.log_file:
+        configure_logging(args.log_file)
+
+    args.handler(parser, args)
+
+
+if __name__ == '__main__':
+    main()
@@ -86,13 +86,11 @@ def exercise_4():
 
     return bigrams
 
-def exercise_5(seed='', depth=1):
+def exercise_5(seed='', depth=1, filename='files/lab01/norm_wiki_sample.txt', output_length=10 ** 3):
     """ Markov chain text generator (letters).
         See: exercises/lab01.pdf -> Exercise 5 """
 
-    output_length = 10 ** 3
-
-    corpus = get_file_content('files/lab01/norm_wiki_sample.txt')
+    corpus = get_file_content(filename)
     ngrams = defaultdict(lambda: defaultdict(int))
 
     for letter_idx in range(depth, len(corpus)):
@@ -124,8 +122,9 @@ if __name__ == '__main__':
     if (len(sys.argv) < 2):
         print('Usage: %s [exercise_id]' % sys.argv[0])
         sys.exit(2)
-    try:
-        print(globals()['exercise_{}'.format(sys.argv[1])]())
+    exercise = globals().get('exercise_{}'.format(sys.argv[1]))
+    if exercise is None:
+        print("Err: Exercise not found!")
+        sys.exit(2)
 
-    except:
-        print("Err: Exercise not found!")
\ No newline at end of file
+    print(exercise())
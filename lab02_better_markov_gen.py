@@ -39,12 +39,11 @@ def exercise_2():
 
     return ' '.join(output_text)
 
-def exercise_3(seed='probability', depth=5):
+def exercise_3(seed='probability', depth=5, filename='files/lab01/norm_wiki_sample.txt', output_length=10 ** 4):
     """ Markov chain text generator (words).
         See: exercises/lab01.pdf -> Exercise 5 """
 
-    output_length = 10 ** 4
-    corpus = get_file_content('files/lab01/norm_wiki_sample.txt').split()
+    corpus = get_file_content(filename).split()
 
     ngrams = defaultdict(lambda: defaultdict(int))
 
@@ -78,7 +77,9 @@ if __name__ == '__main__':
         print('Usage: %s [exercise_id]' % sys.argv[0])
         sys.exit(2)
         
-    try:
-        print(globals()['exercise_{}'.format(sys.argv[1])]())
-    except:
-        print("Err: Exercise not found!")
\ No newline at end of file
+    exercise = globals().get('exercise_{}'.format(sys.argv[1]))
+    if exercise is None:
+        print("Err: Exercise not found!")
+        sys.exit(2)
+
+    print(exercise())
@@ -67,8 +67,9 @@ if __name__ == '__main__':
     if (len(sys.argv) < 2):
         print('Usage: %s [exercise_id]' % sys.argv[0])
         sys.exit(2)
-    try:
-        print(globals()['exercise_{}'.format(sys.argv[1])]())
+    exercise = globals().get('exercise_{}'.format(sys.argv[1]))
+    if exercise is None:
+        print("Err: Exercise not found!")
+        sys.exit(2)
 
-    except:
-        print("Err: Exercise not found!")
\ No newline at end of file
+    print(exercise())
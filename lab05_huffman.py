@@ -5,19 +5,14 @@ import pickle
 import sys
 from collections import defaultdict
 from datetime import datetime
-from math import ceil
+from math import ceil, log2
 
-import numpy as np
 from bitarray import bitarray
 
-logger = logging.getLogger(__name__)
-logging.basicConfig(filename=f'files/lab05/lab05-compression-{datetime.now().strftime("%I_%M_%S%p")}.log', format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-                    datefmt='%d-%m-%Y %I:%M:%S %p', level=logging.DEBUG)
-
-from lab03_conditional_entropy import calculate_entropy
-from lab01_simple_markov_gen import conver_array_to_probabilities
 from lab04_fixed_length_compression import Compressor
 
+logger = logging.getLogger(__name__)
+
 class Metadata:
     def __init__(self, add_bits, tree):
         self.bits = add_bits
@@ -34,6 +29,14 @@ class Node:
     def __str__(self):
         return f'{self.character} : {self.weight}'
 
+class MetadataUnpickler(pickle.Unpickler):
+    """ Resolve Metadata/Node pickled by `python lab05_huffman.py` (as __main__) """
+
+    def find_class(self, module, name):
+        if module == '__main__' and name in ('Metadata', 'Node'):
+            module = __name__
+        return super().find_class(module, name)
+
 class HuffmanCompressor(Compressor):
 
     def __init__(self, filename=None, outputpath=''):
@@ -49,17 +52,17 @@ class HuffmanCompressor(Compressor):
     def create(self):
         try:
             self.data = open(self.filename, 'r').read()
-            logging.info(f'File loaded! ({self.filename})')
+            logger.info(f'File loaded! ({self.filename})')
             super(HuffmanCompressor, self)._construct_probs_dict()
             self.__create_tree()
 
         except FileNotFoundError:
-            logging.error(f'File not found!')
+            logger.error(f'File not found!')
 
 
     def encode(self):
         try:
-            logging.info("Compressing...")
+            logger.info("Compressing...")
 
             self.encoded_string = bitarray()
             self.words = defaultdict(int)
@@ -70,16 +73,16 @@ class HuffmanCompressor(Compressor):
                 self.words[word] += 1
                 self.encoded_string.extend(word)
 
-            logging.info(f"Done! ({self.encoded_string.length()} bits) ")
+            logger.info(f"Done! ({len(self.encoded_string)} bits) ")
 
         except TypeError:
-            logging.warning("Initialize data first!")
+            logger.warning("Initialize data first!")
 
 
     def save(self, output_filename="compressed_file.bin", output_alphabet_filename='alphabet.bin'):
 
         num_additional_bits = self.encoded_string.fill()
-        logging.info(f'Added {num_additional_bits} extra bits!')
+        logger.info(f'Added {num_additional_bits} extra bits!')
 
         with open(self.outputpath + output_filename, 'wb') as file:
             self.encoded_string.tofile(file)
@@ -87,26 +90,29 @@ class HuffmanCompressor(Compressor):
         with open(self.outputpath + output_alphabet_filename, 'wb') as file:
             pickle.dump(Metadata(num_additional_bits, self.tree), file)
 
-        self.encoded_string = self.encoded_string[:-num_additional_bits]
-        logging.info(f'{output_filename} & {output_alphabet_filename} has been saved.')
+        self.encoded_string = self.encoded_string[:len(self.encoded_string) - num_additional_bits]
+        logger.info(f'{output_filename} & {output_alphabet_filename} has been saved.')
 
     def load(self, filename="compressed_file.bin", alphabet='alphabet.bin'):
 
         self.encoded_string = bitarray()
 
-        logging.info(f'Loading {filename} & {alphabet}.')
+        logger.info(f'Loading {filename} & {alphabet}.')
 
         with open(self.outputpath + filename, 'rb') as file:
             self.encoded_string.fromfile(file)
 
         with open(self.outputpath + alphabet, 'rb') as file:
-            metadata = pickle.load(file)
+            metadata = MetadataUnpickler(file).load()
 
-        self.encoded_string = self.encoded_string[:-metadata.bits]
+        self.encoded_string = self.encoded_string[:len(self.encoded_string) - metadata.bits]
         self.tree = metadata.tree
 
     def calculate_eff(self):
-        fixed_length = int(ceil(np.log2(len(self.alphabet))))
+        from lab01_simple_markov_gen import conver_array_to_probabilities
+        from lab03_conditional_entropy import calculate_entropy
+
+        fixed_length = int(ceil(log2(len(self.alphabet))))
         items, values = zip(*self.words.items())
         probabilities = conver_array_to_probabilities(values)
 
@@ -120,10 +126,10 @@ class HuffmanCompressor(Compressor):
 
         try:
             chars = []
-            bits, total_size = self.encoded_string[::-1], self.encoded_string.length()
+            bits, total_size = self.encoded_string[::-1], len(self.encoded_string)
             current_node = self.tree
 
-            while(bits.length()):
+            while(len(bits)):
 
                 current_node = current_node.child_right if bits.pop() else current_node.child_left
 
@@ -133,11 +139,11 @@ class HuffmanCompressor(Compressor):
 
             self.data = ''.join(chars)
 
-            logging.info("Decoded")
+            logger.info("Decoded")
         except TypeError:
-            logging.warning("Initialize data first!")
+            logger.warning("Initialize data first!")
         except KeyboardInterrupt:
-            logging.warning(f"Keyboard interrupt! ({round((total_size - len(bits))/total_size, 2)}%)")
+            logger.warning(f"Keyboard interrupt! ({round((total_size - len(bits))/total_size, 2)}%)")
 
 
     def __create_tree(self):
@@ -162,12 +168,22 @@ class HuffmanCompressor(Compressor):
             del nodes[-2:]
             nodes.append(new_node)
 
+        # Single symbol: the tree is a lone leaf, so give it a 1-bit code (0).
+        if nodes[0].leaf:
+            new_node = Node(nodes[0].character, nodes[0].weight)
+            new_node.child_left = nodes[0]
+            self.char_to_bin[nodes[0].character].append('0')
+            nodes[0] = new_node
+
         self.tree = nodes[0]
         self.char_to_bin = {key: ''.join(value)[::-1] for key, value in self.char_to_bin.items()}
         self.bin_to_char = {value: key for key, value in self.char_to_bin.items()}
 
 
 def main():
+    logging.basicConfig(filename=f'files/lab05/lab05-compression-{datetime.now().strftime("%I_%M_%S%p")}.log', format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                        datefmt='%d-%m-%Y %I:%M:%S %p', level=logging.DEBUG)
+
     file = 'files/lab01/norm_wiki_sample.txt' if len(sys.argv) == 1 else sys.argv[1]
 
     print("Compressor A... ", end=' ')